@@ -1,15 +1,40 @@
 import os
 import json
+import threading
+import uuid
 from datetime import datetime
-from typing import Optional
-import google.generativeai as genai
+from typing import Dict, Optional
 from .schemas import VideoScript, GeminiRequest
 
+# genai.configure() sets a process-wide key, and a GenerativeModel picks it up
+# when its client is created. This lock covers configuring a key and binding
+# a client to the model; the Gemini call itself runs outside it.
+_GENAI_LOCK = threading.Lock()
+
+
+def _load_genai():
+    """Pick the Gemini SDK, or the local stand-in when GEMINI_MOCK is set"""
+    if os.getenv("GEMINI_MOCK", "").lower() in ("1", "true", "yes"):
+        from .mock_gemini import MockGenAI
+
+        print("🧪 GEMINI_MOCK is set, using the local Gemini stand-in")
+        return MockGenAI.from_env()
+
+    import google.generativeai as genai
+
+    return genai
+
 
 class GeminiClient:
     """Gemini AI client for generating video scripts with key rotation"""
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, genai_module=None):
+        self.genai = genai_module or _load_genai()
+
+        # Per-key attempt counters, shared across request threads
+        self._stats_lock = threading.Lock()
+        self.key_stats: Dict[str, Dict[str, int]] = {}
+
         # Load all available keys starting with GEMINI_API_
         self.api_keys = []
 
@@ -30,17 +55,16 @@ class GeminiClient:
             )
 
         print(f"🔑 Loaded {len(self.api_keys)} Gemini API keys from environment")
-        self._rotate_key()
 
     def _mask_key(self, key: str) -> str:
         """Mask key for logging"""
         return f"{key[:4]}...{key[-4:]}" if len(key) > 8 else "***"
 
     def _configure_client(self, api_key: str):
-        """Configure GenAI with a specific key"""
+        """Configure GenAI with a specific key and return the model"""
         print(f"🔄 Switching to Gemini API Key: {self._mask_key(api_key)}")
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel(
+        self.genai.configure(api_key=api_key)
+        self.model = self.genai.GenerativeModel(
             model_name=os.getenv("GEMINI_MODEL", "gemini-1.5-flash"),
             generation_config={
                 "temperature": 0.9,
@@ -49,6 +73,42 @@ class GeminiClient:
                 "max_output_tokens": 8192,
             },
         )
+        return self.model
+
+    def _bind_client(self, model):
+        """Create the model's client now so it keeps the configured key"""
+        # The SDK creates the client lazily on the first call, from whatever key
+        # is configured at that moment; another thread may have switched it
+        model._client = self.genai.client.get_default_generative_client()
+        return model
+
+    def _record_attempt(self, api_key: str, error: Optional[str] = None):
+        """Count an attempt against a key for load distribution stats"""
+        with self._stats_lock:
+            stats = self.key_stats.setdefault(
+                self._mask_key(api_key),
+                {
+                    "attempts": 0,
+                    "successes": 0,
+                    "rate_limited": 0,
+                    "malformed_json": 0,
+                    "failures": 0,
+                },
+            )
+            stats["attempts"] += 1
+            if error is None:
+                stats["successes"] += 1
+            elif "429" in error or "exhausted" in error.lower():
+                stats["rate_limited"] += 1
+            elif "Invalid JSON" in error:
+                stats["malformed_json"] += 1
+            else:
+                stats["failures"] += 1
+
+    def get_key_stats(self) -> Dict[str, Dict[str, int]]:
+        """Snapshot of per-key attempt counters (keys masked)"""
+        with self._stats_lock:
+            return {key: dict(stats) for key, stats in self.key_stats.items()}
 
     def generate_script(self, request: GeminiRequest) -> VideoScript:
         """Generate a video script from a topic using Gemini with auto-switching on failure"""
@@ -66,12 +126,14 @@ class GeminiClient:
 
         for i, api_key in enumerate(keys_to_try):
             try:
-                self._configure_client(api_key)
+                with _GENAI_LOCK:
+                    model = self._bind_client(self._configure_client(api_key))
+
                 print(
                     f"🤖 Calling Gemini API (Attempt {i + 1}/{len(keys_to_try)}) for topic: {request.topic}"
                 )
 
-                response = self.model.generate_content(prompt)
+                response = model.generate_content(prompt)
 
                 if not response.text:
                     raise ValueError("Empty response from Gemini")
@@ -80,7 +142,9 @@ class GeminiClient:
                 script_data = self._parse_response(response.text)
 
                 # Add metadata
-                script_data["id"] = f"script_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+                script_data["id"] = (
+                    f"script_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:6]}"
+                )
                 script_data["topic"] = request.topic
                 script_data["metadata"]["created_at"] = datetime.now().isoformat()
                 script_data["metadata"]["target_platforms"] = request.target_platforms
@@ -88,6 +152,7 @@ class GeminiClient:
                 # Validate and create VideoScript
                 script = VideoScript(**script_data)
 
+                self._record_attempt(api_key)
                 print(f"✅ Script generated: {script.id}")
                 print(f"   - Title: {script.title}")
                 print(f"   - Duration: {script.total_duration}s")
@@ -102,6 +167,7 @@ class GeminiClient:
                     f"⚠️ Attempt failed with key {self._mask_key(api_key)}: {error_msg}"
                 )
                 errors.append(f"{self._mask_key(api_key)}: {error_msg}")
+                self._record_attempt(api_key, error_msg)
 
                 # If we have more keys to try, continue
                 if i < len(keys_to_try) - 1:
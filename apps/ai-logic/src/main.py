@@ -44,6 +44,18 @@ async def health_check():
     return {"status": "healthy", "gemini_configured": gemini_client is not None}
 
 
+@app.get("/stats")
+async def stats():
+    """Per-key Gemini attempt counters (keys masked)"""
+    if not gemini_client:
+        raise HTTPException(
+            status_code=500,
+            detail="Gemini client not initialized. Check GEMINI_API_KEY.",
+        )
+
+    return {"keys": gemini_client.get_key_stats()}
+
+
 @app.post("/generate-script", response_model=GeminiResponse)
 async def generate_script(request: GeminiRequest):
     """
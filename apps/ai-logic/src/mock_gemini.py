@@ -0,0 +1,153 @@
+# Local Gemini stand-in for offline load testing
+import json
+import os
+import random
+import re
+import threading
+import time
+from typing import Iterable, Optional
+
+
+class MockRateLimitError(Exception):
+    """Stand-in for Gemini's 429 ResourceExhausted error"""
+
+
+class MockClient:
+    """Stand-in for the SDK's generative client, bound to one API key"""
+
+    def __init__(self, api_key: Optional[str]):
+        self.api_key = api_key
+
+
+class MockResponse:
+    """Minimal response object exposing `.text` like the real SDK"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class MockGenAI:
+    """Drop-in for the `google.generativeai` module with configurable faults"""
+
+    def __init__(
+        self,
+        latency_ms: float = 800.0,
+        jitter_ms: float = 200.0,
+        rate_limit_rate: float = 0.0,
+        malformed_rate: float = 0.0,
+        exhausted_keys: Iterable[str] = (),
+        seed: Optional[int] = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.rate_limit_rate = rate_limit_rate
+        self.malformed_rate = malformed_rate
+        # Keys that always answer 429, to exercise rotation
+        self.exhausted_keys = set(exhausted_keys)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._api_key: Optional[str] = None
+        # Mirrors the SDK's `genai.client` module
+        self.client = self
+
+    @classmethod
+    def from_env(cls) -> "MockGenAI":
+        """Build from GEMINI_MOCK_* environment variables"""
+        seed = os.getenv("GEMINI_MOCK_SEED")
+        return cls(
+            latency_ms=float(os.getenv("GEMINI_MOCK_LATENCY_MS", "800")),
+            jitter_ms=float(os.getenv("GEMINI_MOCK_JITTER_MS", "200")),
+            rate_limit_rate=float(os.getenv("GEMINI_MOCK_429_RATE", "0")),
+            malformed_rate=float(os.getenv("GEMINI_MOCK_MALFORMED_RATE", "0")),
+            exhausted_keys=[
+                key.strip()
+                for key in os.getenv("GEMINI_MOCK_EXHAUSTED_KEYS", "").split(",")
+                if key.strip()
+            ],
+            seed=int(seed) if seed else None,
+        )
+
+    def configure(self, api_key: str):
+        """Mirror genai.configure: a process-wide key read at call time"""
+        self._api_key = api_key
+
+    def get_default_generative_client(self) -> MockClient:
+        """Client for the currently configured key"""
+        return MockClient(self._api_key)
+
+    def GenerativeModel(self, model_name: str, generation_config=None):
+        return MockModel(self, model_name)
+
+    def _complete(self, api_key: Optional[str], prompt: str) -> MockResponse:
+        with self._lock:
+            delay = max(
+                0.0, self.latency_ms + self._random.uniform(-1, 1) * self.jitter_ms
+            )
+            roll = self._random.random()
+
+        time.sleep(delay / 1000)
+
+        if api_key in self.exhausted_keys or roll < self.rate_limit_rate:
+            raise MockRateLimitError(
+                "429 Resource has been exhausted (e.g. check quota)."
+            )
+
+        text = json.dumps(self._script(prompt))
+        if roll < self.rate_limit_rate + self.malformed_rate:
+            # Truncated mid-object, like a response cut off at the token limit
+            text = f"```json\n{text[: len(text) // 2]}\n```"
+        return MockResponse(text)
+
+    def _script(self, prompt: str) -> dict:
+        """Build a script matching the prompt's JSON structure"""
+        topic = self._field(prompt, "Topic", "Mock topic")
+        duration = float(self._field(prompt, "Target Duration", "15").split()[0])
+        scene_count = max(1, min(10, round(duration / 5)))
+        scene_duration = round(duration / scene_count, 2)
+
+        return {
+            "title": f"Mock: {topic}",
+            "description": f"Mock script about {topic}",
+            "total_duration": duration,
+            "scenes": [
+                {
+                    "id": f"scene_{i + 1}",
+                    "duration": scene_duration,
+                    "type": "text",
+                    "content": f"{topic} #{i + 1}",
+                    "transition": "fade",
+                    "transition_duration": 0.5,
+                }
+                for i in range(scene_count)
+            ],
+            "captions": [
+                {
+                    "text": f"{topic} #{i + 1}",
+                    "start_time": round(i * scene_duration, 2),
+                    "end_time": round((i + 1) * scene_duration, 2),
+                }
+                for i in range(scene_count)
+            ],
+            "audio_tracks": [],
+            "metadata": {"hashtags": ["mock"]},
+        }
+
+    @staticmethod
+    def _field(prompt: str, name: str, default: str) -> str:
+        match = re.search(rf"^{name}: (.+)$", prompt, re.MULTILINE)
+        return match.group(1).strip() if match else default
+
+
+class MockModel:
+    """Model that, like the SDK, takes the configured key when its client is made"""
+
+    def __init__(self, genai: MockGenAI, model_name: str):
+        self._genai = genai
+        self.model_name = model_name
+        self._client: Optional[MockClient] = None
+
+    def generate_content(self, prompt: str) -> MockResponse:
+        # Lazily created from the global key, so unbound models race like the SDK
+        if self._client is None:
+            self._client = self._genai.client.get_default_generative_client()
+        return self._genai._complete(self._client.api_key, prompt)
@@ -0,0 +1,11 @@
+import os
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def no_env_keys(monkeypatch):
+    """Keep real GEMINI_API_* keys out of GeminiClient under test"""
+    for name in list(os.environ):
+        if name.startswith("GEMINI_API_"):
+            monkeypatch.delenv(name)
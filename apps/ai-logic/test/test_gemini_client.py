@@ -0,0 +1,43 @@
+import threading
+import time
+
+from src.gemini_client import GeminiClient
+from src.mock_gemini import MockGenAI
+from src.schemas import GeminiRequest
+
+
+def make_client(genai: MockGenAI, *keys: str) -> GeminiClient:
+    client = GeminiClient(api_key=keys[0], genai_module=genai)
+    client.api_keys = list(keys)
+    return client
+
+
+def test_bound_model_keeps_its_key_after_reconfigure():
+    genai = MockGenAI(latency_ms=0, jitter_ms=0, exhausted_keys=["key-b-0000"])
+    client = make_client(genai, "key-a-0000")
+
+    model = client._bind_client(client._configure_client("key-a-0000"))
+    genai.configure(api_key="key-b-0000")
+
+    # Would raise a 429 if the call picked up the newly configured key
+    assert model.generate_content("Topic: Cats").text
+
+
+def test_concurrent_scripts_call_gemini_in_parallel():
+    latency = 0.3
+    genai = MockGenAI(latency_ms=latency * 1000, jitter_ms=0)
+    client = make_client(genai, "key-a-0000")
+    scripts = []
+
+    def generate():
+        scripts.append(client.generate_script(GeminiRequest(topic="Cats")))
+
+    threads = [threading.Thread(target=generate) for _ in range(4)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(scripts) == 4
+    assert time.perf_counter() - started < 2 * latency
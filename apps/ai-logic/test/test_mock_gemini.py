@@ -0,0 +1,104 @@
+import json
+import random
+import time
+
+import pytest
+
+from src.gemini_client import GeminiClient
+from src.mock_gemini import MockGenAI, MockRateLimitError
+from src.schemas import GeminiRequest
+
+PROMPT = "Topic: Why Cats Purr\nTarget Duration: 15 seconds\n"
+# Distinct when masked to first and last four characters
+KEY_A, KEY_B = "aaaa-key-1111", "bbbb-key-2222"
+
+
+def outcome(genai: MockGenAI, api_key: str = KEY_A) -> str:
+    genai.configure(api_key=api_key)
+    try:
+        text = genai.GenerativeModel("mock").generate_content(PROMPT).text
+    except MockRateLimitError:
+        return "rate_limited"
+    try:
+        json.loads(text.strip().removeprefix("```json").removesuffix("```"))
+    except json.JSONDecodeError:
+        return "malformed_json"
+    return "ok"
+
+
+def test_seeded_mock_hits_configured_fault_rates():
+    calls = 2000
+    genai = MockGenAI(
+        latency_ms=0, jitter_ms=0, rate_limit_rate=0.1, malformed_rate=0.3, seed=7
+    )
+
+    outcomes = [outcome(genai) for _ in range(calls)]
+
+    assert outcomes.count("rate_limited") / calls == pytest.approx(0.1, abs=0.03)
+    assert outcomes.count("malformed_json") / calls == pytest.approx(0.3, abs=0.03)
+
+
+def test_same_seed_replays_same_faults():
+    def run():
+        genai = MockGenAI(
+            latency_ms=0, jitter_ms=0, rate_limit_rate=0.2, malformed_rate=0.2, seed=3
+        )
+        return [outcome(genai) for _ in range(50)]
+
+    assert run() == run()
+
+
+def test_mock_script_validates():
+    genai = MockGenAI(latency_ms=0, jitter_ms=0)
+    client = GeminiClient(api_key=KEY_A, genai_module=genai)
+
+    script = client.generate_script(GeminiRequest(topic="Cats", target_duration=20))
+
+    assert script.topic == "Cats"
+    assert script.total_duration == 20
+    assert len(script.scenes) == 4
+
+
+def test_exhausted_keys_always_rate_limit():
+    genai = MockGenAI(latency_ms=0, jitter_ms=0, exhausted_keys=[KEY_A])
+
+    assert {outcome(genai, KEY_A) for _ in range(20)} == {"rate_limited"}
+    assert {outcome(genai, KEY_B) for _ in range(20)} == {"ok"}
+
+
+def test_exhausted_key_rotates_to_next(monkeypatch):
+    # Try keys in sorted order so the exhausted key always goes first
+    monkeypatch.setattr(random, "shuffle", lambda keys: keys.sort())
+    monkeypatch.setattr(time, "sleep", lambda seconds: None)
+    genai = MockGenAI(latency_ms=0, jitter_ms=0, exhausted_keys=[KEY_A])
+    client = GeminiClient(api_key=KEY_A, genai_module=genai)
+    client.api_keys.append(KEY_B)
+
+    for _ in range(3):
+        client.generate_script(GeminiRequest(topic="Cats"))
+
+    stats = client.get_key_stats()
+    exhausted, healthy = stats[client._mask_key(KEY_A)], stats[client._mask_key(KEY_B)]
+    assert exhausted["attempts"] == exhausted["rate_limited"] == 3
+    assert healthy["attempts"] == healthy["successes"] == 3
+
+
+@pytest.mark.parametrize(
+    "error, counter",
+    [
+        (None, "successes"),
+        ("429 Resource has been exhausted (e.g. check quota).", "rate_limited"),
+        ("Quota exhausted", "rate_limited"),
+        ("Invalid JSON response from Gemini: Expecting value", "malformed_json"),
+        ("Empty response from Gemini", "failures"),
+    ],
+)
+def test_record_attempt_classifies_errors(error, counter):
+    client = GeminiClient(api_key=KEY_A, genai_module=MockGenAI())
+
+    client._record_attempt(KEY_A, error)
+
+    (stats,) = client.get_key_stats().values()
+    assert stats["attempts"] == 1
+    assert stats[counter] == 1
+    assert sum(stats.values()) == 2
@@ -0,0 +1,106 @@
+# Command-line entry point for the in-process script -> video pipeline
+import argparse
+import os
+import sys
+import time
+from dotenv import load_dotenv
+from .pipeline import VideoPipeline, load_ai_logic
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Generate scripts with Gemini and render them to video in one process"
+    )
+    parser.add_argument("topics", nargs="*", help="Video topics to produce")
+    parser.add_argument(
+        "--topics-file", help="File with one topic per line (blank lines ignored)"
+    )
+    parser.add_argument(
+        "--style",
+        default="entertaining",
+        choices=["educational", "entertaining", "informative", "promotional"],
+    )
+    parser.add_argument("--duration", type=float, default=60, help="Target seconds")
+    parser.add_argument(
+        "--platforms",
+        nargs="+",
+        default=["tiktok", "instagram", "youtube"],
+        choices=["tiktok", "instagram", "youtube"],
+    )
+    parser.add_argument("--output-dir", default="output")
+    parser.add_argument("--script-workers", type=int, default=2)
+    parser.add_argument("--prefetch-workers", type=int, default=4)
+    parser.add_argument("--render-workers", type=int, default=1)
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=2,
+        help="Validated scripts allowed to wait for a renderer",
+    )
+    parser.add_argument("--ai-logic-dir", help="Path to the ai-logic app")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = parse_args(argv)
+
+    topics = list(args.topics)
+    if args.topics_file:
+        with open(args.topics_file) as f:
+            topics.extend(line.strip() for line in f if line.strip())
+    if not topics:
+        topics = [os.getenv("VIDEO_TOPIC", "The Future of AI in 2026")]
+
+    print("\n╔════════════════════════════════════════╗")
+    print("║      SCRIPT → VIDEO PIPELINE           ║")
+    print("╚════════════════════════════════════════╝\n")
+
+    ai_logic = load_ai_logic(args.ai_logic_dir)
+    client = ai_logic.gemini_client.GeminiClient()
+    requests = [
+        ai_logic.schemas.GeminiRequest(
+            topic=topic,
+            style=args.style,
+            target_duration=args.duration,
+            target_platforms=args.platforms,
+        )
+        for topic in topics
+    ]
+
+    pipeline = VideoPipeline(
+        client,
+        output_dir=args.output_dir,
+        width=int(os.getenv("VIDEO_WIDTH", "1080")),
+        height=int(os.getenv("VIDEO_HEIGHT", "1920")),
+        fps=int(os.getenv("VIDEO_FPS", "30")),
+        buffer_frames=int(os.getenv("VIDEO_FRAME_BUFFER", "8")),
+        script_workers=args.script_workers,
+        prefetch_workers=args.prefetch_workers,
+        render_workers=args.render_workers,
+        queue_size=args.queue_size,
+    )
+
+    print(f"🚀 Running {len(requests)} topic(s)\n")
+    started = time.perf_counter()
+    results = pipeline.run(requests)
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{'=' * 50}")
+    for result in results:
+        if result.success:
+            print(
+                f"✅ {result.topic}: {result.output_path} "
+                f"(script {result.script_seconds:.1f}s, render {result.render_seconds:.1f}s)"
+            )
+        else:
+            print(f"❌ {result.topic}: {result.error}")
+    succeeded = sum(result.success for result in results)
+    print(f"\n📊 {succeeded}/{len(results)} succeeded in {elapsed:.1f}s")
+    print(f"{'=' * 50}\n")
+
+    return 0 if succeeded == len(results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,515 @@
+import os
+import queue
+import threading
+from io import BytesIO
+from pathlib import Path
+from concurrent.futures import Future
+from typing import Any, Dict, List, Mapping, Optional
+
+import ffmpeg
+import numpy as np
+import requests
+from PIL import Image, ImageColor, ImageDraw, ImageFont
+
+# Caption pop-in keyframes: sprite scale for the first frames of a caption
+POP_SCALES = (0.6, 0.8, 0.95, 1.06, 1.03, 1.0)
+
+# Vertical anchor (fraction of frame height) for each caption position
+CAPTION_ANCHORS = {"top": 0.12, "center": 0.5, "bottom": 0.78}
+
+# Largest image a scene may download or read (VIDEO_MAX_ASSET_BYTES)
+DEFAULT_MAX_ASSET_BYTES = 20 * 1024 * 1024
+
+# SceneStyle defaults, used when a caption style value is missing or invalid
+CAPTION_DEFAULTS = {
+    "font_size": 48,
+    "font_color": "#FFFFFF",
+    "background_color": "#000000AA",
+}
+
+
+def load_image(location: str) -> Optional[Image.Image]:
+    """
+    Load an image from an http(s) URL or the asset directory, or None
+
+    Scene content comes from request bodies, so local paths are only read
+    from inside VIDEO_ASSET_DIR (none when unset) and downloads stop at
+    VIDEO_MAX_ASSET_BYTES.
+    """
+    try:
+        if location.startswith(("http://", "https://")):
+            image = Image.open(BytesIO(_download(location, _max_asset_bytes())))
+        else:
+            path = _asset_path(location)
+            if path is None or not path.is_file():
+                return None
+            if path.stat().st_size > _max_asset_bytes():
+                raise ValueError(f"larger than {_max_asset_bytes()} bytes")
+            image = Image.open(path)
+        image.load()
+        return image
+    except Exception as e:
+        print(f"   ⚠️ Could not load image {location}: {e}")
+        return None
+
+
+def _max_asset_bytes() -> int:
+    return int(os.getenv("VIDEO_MAX_ASSET_BYTES", str(DEFAULT_MAX_ASSET_BYTES)))
+
+
+def _asset_path(location: str) -> Optional[Path]:
+    """Resolve `location` inside VIDEO_ASSET_DIR, or None if it points outside"""
+    asset_dir = os.getenv("VIDEO_ASSET_DIR")
+    if not asset_dir:
+        return None
+    root = Path(asset_dir).resolve()
+    path = (root / location).resolve()
+    return path if path.is_relative_to(root) else None
+
+
+def _download(url: str, limit: int) -> bytes:
+    """Fetch `url`, refusing bodies larger than `limit` bytes"""
+    with requests.get(url, timeout=30, stream=True) as response:
+        response.raise_for_status()
+        if int(response.headers.get("Content-Length") or 0) > limit:
+            raise ValueError(f"larger than {limit} bytes")
+        data = bytearray()
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            data += chunk
+            if len(data) > limit:
+                raise ValueError(f"larger than {limit} bytes")
+        return bytes(data)
+
+
+class _SceneTrack:
+    """Prepared scene: source pixels plus per-frame transforms and fade levels"""
+
+    def __init__(
+        self,
+        source: np.ndarray,
+        transforms: np.ndarray,
+        alphas: np.ndarray,
+        fill: np.ndarray,
+        height: int,
+    ):
+        self.source = source
+        # Row-gather scratch buffer, reused for every frame of the scene
+        self.rows = np.empty((height, source.shape[1], 3), dtype=np.uint8)
+        # Axis-aligned affine per frame: (sx, tx, sy, ty), src = s * dst + t
+        self.transforms = transforms
+        self.alphas = alphas
+        self.fill = fill
+        self.frames = len(transforms)
+
+
+class _CaptionSprite:
+    """Pre-rendered caption with its pop-in variants"""
+
+    def __init__(self, start_frame: int, end_frame: int, variants: List[tuple]):
+        self.start_frame = start_frame
+        self.end_frame = end_frame
+        # Each variant: (y, x, premultiplied rgb, inverse alpha, work buffer)
+        self.variants = variants
+
+
+class FrameCompositor:
+    """Frame-level compositor that streams animated scenes into FFmpeg"""
+
+    def __init__(
+        self,
+        width: int = 1080,
+        height: int = 1920,
+        fps: int = 30,
+        buffer_frames: int = 8,
+        background: str = "#1a1a1a",
+    ):
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.buffer_frames = max(1, buffer_frames)
+        self.background = background
+
+        # Sampling grids and scratch buffers, reused for every frame
+        self._x_grid = np.arange(width, dtype=np.float32) + 0.5
+        self._y_grid = np.arange(height, dtype=np.float32) + 0.5
+        self._x_coords = np.empty(width, dtype=np.float32)
+        self._y_coords = np.empty(height, dtype=np.float32)
+        self._x_index = np.empty(width, dtype=np.intp)
+        self._y_index = np.empty(height, dtype=np.intp)
+        self._blend = np.empty((height, width, 3), dtype=np.float32)
+
+    def render(
+        self,
+        scenes: List[Dict[str, Any]],
+        captions: List[Dict[str, Any]],
+        output: str,
+        assets: Optional[Mapping[str, Future]] = None,
+    ) -> int:
+        """
+        Render all scenes and captions into a single H.264 file
+
+        Args:
+            scenes: Scene dictionaries from the video script
+            captions: Caption dictionaries from the video script
+            output: Output file path
+            assets: Optional in-flight image downloads keyed by scene content
+
+        Returns:
+            Number of frames written
+        """
+        sprites = self._prepare_captions(captions)
+
+        # Bounded pool: at most `buffer_frames` frames exist at any time
+        free: "queue.Queue[np.ndarray]" = queue.Queue()
+        for _ in range(self.buffer_frames):
+            free.put(np.empty((self.height, self.width, 3), dtype=np.uint8))
+        filled: "queue.Queue[Optional[np.ndarray]]" = queue.Queue()
+
+        process = (
+            ffmpeg.input(
+                "pipe:",
+                format="rawvideo",
+                pix_fmt="rgb24",
+                s=f"{self.width}x{self.height}",
+                framerate=self.fps,
+            )
+            .output(output, vcodec="libx264", pix_fmt="yuv420p", r=self.fps)
+            .global_args("-loglevel", "error", "-nostats")
+            .overwrite_output()
+            .run_async(pipe_stdin=True)
+        )
+
+        errors: List[Exception] = []
+        writer = threading.Thread(
+            target=self._write_frames,
+            args=(process, filled, free, errors),
+            daemon=True,
+        )
+        writer.start()
+
+        frame_index = 0
+        try:
+            for i, scene in enumerate(scenes):
+                # Scenes are prepared one at a time, but prefetched images stay
+                # referenced by `assets` until the whole render finishes
+                track = self._prepare_scene(scene, assets or {})
+                for local_index in range(track.frames):
+                    if errors:
+                        raise errors[0]
+                    frame = free.get()
+                    self._draw_scene_frame(track, local_index, frame)
+                    self._draw_captions(sprites, frame_index, frame)
+                    filled.put(frame)
+                    frame_index += 1
+                print(f"   ✓ Scene {i + 1}/{len(scenes)} rendered")
+        finally:
+            filled.put(None)
+            writer.join()
+            try:
+                process.stdin.close()
+            except OSError:
+                pass
+            process.wait()
+
+        if errors:
+            raise errors[0]
+        if process.returncode != 0:
+            raise RuntimeError(f"FFmpeg exited with code {process.returncode}")
+
+        return frame_index
+
+    def _write_frames(
+        self,
+        process,
+        filled: "queue.Queue[Optional[np.ndarray]]",
+        free: "queue.Queue[np.ndarray]",
+        errors: List[Exception],
+    ):
+        """Drain rendered frames into the encoder and recycle their buffers"""
+        while True:
+            frame = filled.get()
+            if frame is None:
+                return
+            try:
+                if not errors:
+                    process.stdin.write(frame.data)
+            except Exception as e:
+                errors.append(e)
+            finally:
+                free.put(frame)
+
+    def _prepare_scene(
+        self, scene: Dict[str, Any], assets: Mapping[str, Future]
+    ) -> _SceneTrack:
+        """Build the source image and motion curves for a scene"""
+        frames = max(1, round(float(scene["duration"]) * self.fps))
+        transition = scene.get("transition", "fade")
+        transition_frames = round(
+            float(scene.get("transition_duration", 0.5)) * self.fps
+        )
+
+        image = None
+        if scene["type"] == "image":
+            pending = assets.get(scene["content"])
+            if pending is not None:
+                # Only waits for this scene's download, later ones keep going
+                image = pending.result()
+            else:
+                image = load_image(scene["content"])
+
+        if image is not None:
+            source = self._cover(image)
+            transforms = self._ken_burns(transition, frames, source.shape)
+            fill = np.zeros(3, dtype=np.float32)
+        else:
+            # Text scenes, video placeholders and unreachable images
+            content = scene["content"]
+            if scene["type"] == "video":
+                content = "Video Scene"
+            elif scene["type"] == "image":
+                content = "Image Scene"
+            source = self._text_card(content)
+            transforms = self._text_motion(transition, frames, transition_frames)
+            fill = np.array(ImageColor.getrgb(self.background), dtype=np.float32)
+
+        alphas = np.ones(frames, dtype=np.float32)
+        if transition == "fade" and transition_frames > 0:
+            ramp = min(transition_frames, frames)
+            alphas[:ramp] = self._ease(np.linspace(0.0, 1.0, ramp, endpoint=False))
+
+        return _SceneTrack(source, transforms, alphas, fill, self.height)
+
+    def _ken_burns(self, transition: str, frames: int, shape: tuple) -> np.ndarray:
+        """Zoom/pan curves over a cover-fitted image"""
+        src_h, src_w = shape[:2]
+        progress = self._ease(np.linspace(0.0, 1.0, frames, dtype=np.float32))
+
+        if transition == "zoom":
+            zoom = 1.0 + 0.2 * progress
+        elif transition == "slide":
+            zoom = np.full(frames, 1.15, dtype=np.float32)
+        elif transition == "fade":
+            zoom = 1.0 + 0.08 * progress
+        else:
+            zoom = np.ones(frames, dtype=np.float32)
+
+        view_w = self.width / zoom
+        view_h = self.height / zoom
+        if transition == "slide":
+            # Pan left to right across the spare width
+            center_x = view_w / 2 + (src_w - view_w) * progress
+        else:
+            center_x = np.full(frames, src_w / 2, dtype=np.float32)
+        center_y = np.full(frames, src_h / 2, dtype=np.float32)
+
+        scale = 1.0 / zoom
+        return np.stack(
+            [scale, center_x - view_w / 2, scale, center_y - view_h / 2], axis=1
+        ).astype(np.float32)
+
+    def _text_motion(
+        self, transition: str, frames: int, transition_frames: int
+    ) -> np.ndarray:
+        """Slide-in or zoom-in curves for a full-frame text card"""
+        transforms = np.zeros((frames, 4), dtype=np.float32)
+        transforms[:, 0] = 1.0
+        transforms[:, 2] = 1.0
+
+        ramp = min(transition_frames, frames)
+        if ramp <= 0:
+            return transforms
+
+        progress = self._ease(np.linspace(0.0, 1.0, ramp, dtype=np.float32))
+        if transition == "slide":
+            # Content starts a quarter-frame low and settles into place
+            transforms[:ramp, 3] = -0.25 * self.height * (1.0 - progress)
+        elif transition == "zoom":
+            zoom = 0.85 + 0.15 * progress
+            transforms[:ramp, 0] = 1.0 / zoom
+            transforms[:ramp, 1] = self.width / 2 * (1.0 - 1.0 / zoom)
+            transforms[:ramp, 2] = 1.0 / zoom
+            transforms[:ramp, 3] = self.height / 2 * (1.0 - 1.0 / zoom)
+
+        return transforms
+
+    def _draw_scene_frame(self, track: _SceneTrack, index: int, frame: np.ndarray):
+        """Sample the scene source into `frame` without allocating"""
+        sx, tx, sy, ty = track.transforms[index]
+        source = track.source
+
+        np.multiply(self._x_grid, sx, out=self._x_coords)
+        np.add(self._x_coords, tx, out=self._x_coords)
+        np.floor(self._x_coords, out=self._x_coords)
+        np.copyto(self._x_index, self._x_coords, casting="unsafe")
+
+        np.multiply(self._y_grid, sy, out=self._y_coords)
+        np.add(self._y_coords, ty, out=self._y_coords)
+        np.floor(self._y_coords, out=self._y_coords)
+        np.copyto(self._y_index, self._y_coords, casting="unsafe")
+
+        # Row gather then column gather; "clip" keeps edges and avoids buffering
+        rows = track.rows
+        np.take(source, self._y_index, axis=0, out=rows, mode="clip")
+        np.take(rows, self._x_index, axis=1, out=frame, mode="clip")
+
+        alpha = track.alphas[index]
+        if alpha < 1.0:
+            np.subtract(frame, track.fill, out=self._blend)
+            np.multiply(self._blend, alpha, out=self._blend)
+            np.add(self._blend, track.fill, out=self._blend)
+            np.copyto(frame, self._blend, casting="unsafe")
+
+    def _draw_captions(
+        self, sprites: List[_CaptionSprite], index: int, frame: np.ndarray
+    ):
+        """Alpha-composite active captions onto `frame` in place"""
+        for sprite in sprites:
+            if not sprite.start_frame <= index < sprite.end_frame:
+                continue
+            step = min(index - sprite.start_frame, len(sprite.variants) - 1)
+            y, x, rgb, inverse_alpha, work = sprite.variants[step]
+            region = frame[y : y + rgb.shape[0], x : x + rgb.shape[1]]
+            np.multiply(region, inverse_alpha, out=work)
+            np.add(work, rgb, out=work)
+            np.copyto(region, work, casting="unsafe")
+
+    def _prepare_captions(self, captions: List[Dict[str, Any]]) -> List[_CaptionSprite]:
+        """Pre-render caption sprites and their pop-in scale variants"""
+        sprites = []
+        for caption in captions:
+            style = caption.get("style") or {}
+            patch = self._caption_patch(caption["text"], style)
+            anchor_y = int(
+                CAPTION_ANCHORS.get(style.get("position", "bottom"), 0.78) * self.height
+            )
+
+            variants = []
+            for scale in POP_SCALES:
+                size = (
+                    max(1, min(self.width, round(patch.width * scale))),
+                    max(1, min(self.height, round(patch.height * scale))),
+                )
+                scaled = np.asarray(
+                    patch.resize(size, Image.Resampling.BILINEAR), dtype=np.float32
+                )
+                alpha = scaled[:, :, 3:4] / 255.0
+                h, w = scaled.shape[:2]
+                x = (self.width - w) // 2
+                y = min(max(0, anchor_y - h // 2), self.height - h)
+                variants.append(
+                    (
+                        y,
+                        x,
+                        np.ascontiguousarray(scaled[:, :, :3] * alpha),
+                        1.0 - alpha,
+                        np.empty((h, w, 3), dtype=np.float32),
+                    )
+                )
+
+            sprites.append(
+                _CaptionSprite(
+                    start_frame=round(float(caption["start_time"]) * self.fps),
+                    end_frame=round(float(caption["end_time"]) * self.fps),
+                    variants=variants,
+                )
+            )
+        return sprites
+
+    def _caption_patch(self, text: str, style: Dict[str, Any]) -> Image.Image:
+        """Draw a caption box as an RGBA image"""
+        font = self._load_font(self._font_size(style.get("font_size")))
+        padding = 24
+        lines = self._wrap(text, font, int(self.width * 0.9) - 2 * padding)
+
+        probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+        bbox = probe.multiline_textbbox((0, 0), "\n".join(lines), font=font)
+        width = min(self.width, bbox[2] - bbox[0] + 2 * padding)
+        height = bbox[3] - bbox[1] + 2 * padding
+
+        patch = Image.new(
+            "RGBA",
+            (width, height),
+            self._color(style.get("background_color"), "background_color"),
+        )
+        ImageDraw.Draw(patch).multiline_text(
+            (padding - bbox[0], padding - bbox[1]),
+            "\n".join(lines),
+            fill=self._color(style.get("font_color"), "font_color"),
+            font=font,
+            align="center",
+        )
+        return patch
+
+    @staticmethod
+    def _font_size(value: Any) -> int:
+        """Caption font size, at least 1px"""
+        try:
+            return max(1, int(value))
+        except (TypeError, ValueError):
+            return CAPTION_DEFAULTS["font_size"]
+
+    @staticmethod
+    def _color(value: Any, field: str) -> tuple:
+        """RGBA for a caption colour, or the SceneStyle default if it won't parse"""
+        try:
+            return ImageColor.getcolor(value, "RGBA")
+        except (AttributeError, TypeError, ValueError):
+            if value is not None:
+                print(f"⚠️ Invalid caption {field} {value!r}, using default")
+            return ImageColor.getcolor(CAPTION_DEFAULTS[field], "RGBA")
+
+    def _text_card(self, text: str) -> np.ndarray:
+        """Render centered text on the background color"""
+        img = Image.new("RGB", (self.width, self.height), color=self.background)
+        draw = ImageDraw.Draw(img)
+        font = self._load_font(72)
+
+        content = "\n".join(self._wrap(text, font, int(self.width * 0.85)))
+        bbox = draw.multiline_textbbox((0, 0), content, font=font)
+        text_width = bbox[2] - bbox[0]
+        text_height = bbox[3] - bbox[1]
+
+        position = (
+            (self.width - text_width) // 2 - bbox[0],
+            (self.height - text_height) // 2 - bbox[1],
+        )
+        draw.multiline_text(position, content, fill="white", font=font, align="center")
+
+        return np.asarray(img, dtype=np.uint8)
+
+    def _cover(self, image: Image.Image) -> np.ndarray:
+        """Resize an image so it covers the frame, preserving aspect ratio"""
+        image = image.convert("RGB")
+        ratio = max(self.width / image.width, self.height / image.height)
+        size = (
+            max(self.width, round(image.width * ratio)),
+            max(self.height, round(image.height * ratio)),
+        )
+        return np.asarray(image.resize(size, Image.Resampling.LANCZOS), dtype=np.uint8)
+
+    def _load_font(self, size: int):
+        """Try to load a nice font, fallback to default"""
+        try:
+            return ImageFont.truetype("arial.ttf", size)
+        except OSError:
+            return ImageFont.load_default(size)
+
+    def _wrap(self, text: str, font, max_width: int) -> List[str]:
+        """Greedy word wrap to fit `max_width` pixels"""
+        lines: List[str] = []
+        for paragraph in text.splitlines() or [""]:
+            line = ""
+            for word in paragraph.split():
+                candidate = f"{line} {word}".strip()
+                if line and font.getlength(candidate) > max_width:
+                    lines.append(line)
+                    line = word
+                else:
+                    line = candidate
+            lines.append(line)
+        return lines
+
+    @staticmethod
+    def _ease(progress: np.ndarray) -> np.ndarray:
+        """Smoothstep easing on [0, 1]"""
+        return progress * progress * (3.0 - 2.0 * progress)
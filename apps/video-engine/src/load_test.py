@@ -0,0 +1,374 @@
+# Load generator for the AI Logic and Video Engine services
+import argparse
+import json
+import math
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+DEFAULT_TOPICS = [
+    "The Future of AI in 2026",
+    "Why Cats Purr",
+    "How Black Holes Form",
+    "Five Morning Habits",
+]
+
+
+def sample_script(duration: float = 3.0) -> Dict[str, Any]:
+    """Short text-only script so /generate-video load needs no network assets"""
+    return {
+        "id": f"loadtest_{uuid.uuid4().hex[:12]}",
+        "topic": "Load test",
+        "title": "Load test",
+        "description": "Synthetic script for load testing",
+        "total_duration": duration,
+        "scenes": [
+            {
+                "id": "scene_1",
+                "duration": duration,
+                "type": "text",
+                "content": "Load test",
+                "transition": "fade",
+                "transition_duration": 0.5,
+            }
+        ],
+        "captions": [{"text": "Load test", "start_time": 0.0, "end_time": duration}],
+        "audio_tracks": [],
+        "metadata": {"created_at": "1970-01-01T00:00:00"},
+    }
+
+
+def classify_error(error: str) -> str:
+    """
+    Bucket an application-level error message
+
+    This is the request's final outcome only. A failed /generate-script
+    lists every key's error, and a malformed reply that a later key
+    recovers from ends as "ok". Per-attempt 429 and malformed-JSON counts
+    come from the AI Logic /stats counters instead.
+    """
+    if "429" in error or "exhausted" in error.lower():
+        return "rate_limited"
+    if "Invalid JSON" in error:
+        return "malformed_json"
+    return "app_error"
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile of `values`"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+class TargetStats:
+    """Thread-safe counters for one endpoint under load"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.latencies: List[float] = []
+        self.outcomes: Counter = Counter()
+        self.scheduled = 0
+        self.skipped = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.elapsed = 0.0
+        self._lock = threading.Lock()
+
+    def try_acquire(self, limit: int) -> bool:
+        """Reserve an in-flight slot, or count the tick as skipped"""
+        with self._lock:
+            self.scheduled += 1
+            if self.in_flight >= limit:
+                self.skipped += 1
+                return False
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            return True
+
+    def record(self, outcome: str, latency: float):
+        with self._lock:
+            self.in_flight -= 1
+            self.outcomes[outcome] += 1
+            self.latencies.append(latency)
+
+    def summary(self) -> Dict[str, Any]:
+        completed = sum(self.outcomes.values())
+        ok = self.outcomes.get("ok", 0)
+        return {
+            "target": self.name,
+            "scheduled": self.scheduled,
+            "completed": completed,
+            "skipped": self.skipped,
+            "peak_in_flight": self.peak_in_flight,
+            "elapsed_seconds": round(self.elapsed, 2),
+            "throughput_rps": round(ok / self.elapsed, 3) if self.elapsed else 0.0,
+            "latency_seconds": {
+                f"p{p}": self._rounded(percentile(self.latencies, p))
+                for p in (50, 95, 99)
+            },
+            "outcomes": dict(self.outcomes),
+        }
+
+    @staticmethod
+    def _rounded(value: Optional[float]) -> Optional[float]:
+        return round(value, 3) if value is not None else None
+
+
+class LoadGenerator:
+    """Open-loop load at a fixed request rate against the FastAPI services"""
+
+    def __init__(
+        self,
+        ai_logic_url: str,
+        video_engine_url: str,
+        rps: float = 1.0,
+        duration: float = 30.0,
+        concurrency: int = 16,
+        timeout: float = 300.0,
+        topics: Optional[List[str]] = None,
+        script_duration: float = 15.0,
+    ):
+        self.ai_logic_url = ai_logic_url.rstrip("/")
+        self.video_engine_url = video_engine_url.rstrip("/")
+        self.rps = rps
+        self.duration = duration
+        self.concurrency = max(1, concurrency)
+        self.timeout = timeout
+        self.topics = topics or DEFAULT_TOPICS
+        self.script_duration = script_duration
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=self.concurrency * 2)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    def run(self, targets: List[str]) -> Dict[str, Any]:
+        """
+        Drive the selected targets concurrently and build a report
+
+        Args:
+            targets: Any of "script" and "video"
+
+        Returns:
+            Report dictionary with per-target stats and per-key distribution
+        """
+        senders: Dict[str, Callable[[int], str]] = {
+            "script": self._send_script,
+            "video": self._send_video,
+        }
+        keys_before = self._key_stats() if "script" in targets else None
+
+        stats = {name: TargetStats(name) for name in targets}
+        drivers = [
+            threading.Thread(target=self._drive, args=(senders[name], stats[name]))
+            for name in targets
+        ]
+        for driver in drivers:
+            driver.start()
+        for driver in drivers:
+            driver.join()
+
+        report: Dict[str, Any] = {
+            "rps": self.rps,
+            "duration_seconds": self.duration,
+            "concurrency": self.concurrency,
+            "targets": [stats[name].summary() for name in targets],
+        }
+        if keys_before is not None:
+            report["key_distribution"] = self._key_delta(keys_before, self._key_stats())
+        return report
+
+    def _drive(self, send: Callable[[int], str], stats: TargetStats):
+        """Fire requests on a fixed schedule; skip ticks when at the in-flight cap"""
+        interval = 1.0 / self.rps
+        started = time.perf_counter()
+        deadline = started + self.duration
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            tick = 0
+            next_at = started
+            while next_at < deadline:
+                delay = next_at - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                if stats.try_acquire(self.concurrency):
+                    pool.submit(self._timed, send, tick, stats)
+                tick += 1
+                next_at = started + tick * interval
+
+        stats.elapsed = time.perf_counter() - started
+
+    def _timed(self, send: Callable[[int], str], tick: int, stats: TargetStats):
+        started = time.perf_counter()
+        try:
+            outcome = send(tick)
+        except requests.Timeout:
+            outcome = "timeout"
+        except requests.ConnectionError:
+            outcome = "connection_error"
+        except Exception as e:
+            outcome = f"client_error:{type(e).__name__}"
+        stats.record(outcome, time.perf_counter() - started)
+
+    def _send_script(self, tick: int) -> str:
+        response = self._session.post(
+            f"{self.ai_logic_url}/generate-script",
+            json={
+                "topic": self.topics[tick % len(self.topics)],
+                "target_duration": self.script_duration,
+            },
+            timeout=self.timeout,
+        )
+        return self._outcome(response)
+
+    def _send_video(self, tick: int) -> str:
+        script = sample_script()
+        response = self._session.post(
+            f"{self.video_engine_url}/generate-video",
+            json={
+                "script": script,
+                "output_bucket": "load-test",
+                "output_key": f"load-test/{script['id']}.mp4",
+            },
+            timeout=self.timeout,
+        )
+        return self._outcome(response)
+
+    def _outcome(self, response: requests.Response) -> str:
+        if response.status_code == 429:
+            return "rate_limited"
+        if response.status_code != 200:
+            return f"http_{response.status_code}"
+        body = response.json()
+        if body.get("success"):
+            return "ok"
+        return classify_error(body.get("error") or "")
+
+    def _key_stats(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """Per-key counters from the AI Logic service, if it exposes them"""
+        try:
+            response = self._session.get(f"{self.ai_logic_url}/stats", timeout=10)
+            response.raise_for_status()
+            return response.json()["keys"]
+        except Exception as e:
+            print(f"⚠️ Could not read AI Logic key stats: {e}")
+            return None
+
+    @staticmethod
+    def _key_delta(
+        before: Optional[Dict[str, Dict[str, int]]],
+        after: Optional[Dict[str, Dict[str, int]]],
+    ) -> Optional[Dict[str, Dict[str, int]]]:
+        if before is None or after is None:
+            return None
+        return {
+            key: {
+                name: count - before.get(key, {}).get(name, 0)
+                for name, count in counters.items()
+            }
+            for key, counters in after.items()
+        }
+
+
+def print_report(report: Dict[str, Any]):
+    print(f"\n{'=' * 50}")
+    print(
+        f"📊 Load test: {report['rps']} rps for {report['duration_seconds']}s "
+        f"(max {report['concurrency']} in flight per target)"
+    )
+    for target in report["targets"]:
+        latency = target["latency_seconds"]
+        print(f"\n🎯 {target['target']}")
+        print(
+            f"   Scheduled: {target['scheduled']}  Completed: {target['completed']}  "
+            f"Skipped (at cap): {target['skipped']}  Peak in flight: {target['peak_in_flight']}"
+        )
+        print(f"   Throughput: {target['throughput_rps']} ok/s")
+        print(
+            f"   Latency p50/p95/p99: {latency['p50']}s / {latency['p95']}s / {latency['p99']}s"
+        )
+        print("   Final outcomes:")
+        for outcome, count in sorted(target["outcomes"].items()):
+            print(f"   - {outcome}: {count}")
+
+    distribution = report.get("key_distribution")
+    if distribution:
+        print("\n🔑 Per-key load (every Gemini attempt)")
+        total = sum(counters["attempts"] for counters in distribution.values()) or 1
+        for key, counters in sorted(distribution.items()):
+            share = counters["attempts"] / total * 100
+            print(
+                f"   {key}: {counters['attempts']} attempts ({share:.0f}%), "
+                f"{counters['successes']} ok, {counters['rate_limited']} rate limited, "
+                f"{counters.get('malformed_json', 0)} malformed JSON, "
+                f"{counters['failures']} failed"
+            )
+        attempts = sum(counters["attempts"] for counters in distribution.values())
+        if attempts:
+            for name in ("rate_limited", "malformed_json"):
+                count = sum(c.get(name, 0) for c in distribution.values())
+                print(f"   {name}: {count / attempts:.1%} of attempts")
+    print(f"{'=' * 50}\n")
+
+
+def main(argv=None) -> int:
+    load_dotenv()
+    parser = argparse.ArgumentParser(
+        description="Drive /generate-script and /generate-video at a target rate"
+    )
+    parser.add_argument(
+        "--targets", nargs="+", default=["script", "video"], choices=["script", "video"]
+    )
+    parser.add_argument("--rps", type=float, default=1.0, help="Requests/s per target")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument(
+        "--concurrency", type=int, default=16, help="Max in-flight requests per target"
+    )
+    parser.add_argument("--timeout", type=float, default=300.0)
+    parser.add_argument("--topics", nargs="+", help="Topics to cycle through")
+    parser.add_argument(
+        "--script-duration", type=float, default=15.0, help="target_duration to request"
+    )
+    parser.add_argument(
+        "--ai-logic-url", default=os.getenv("AI_LOGIC_URL", "http://localhost:8001")
+    )
+    parser.add_argument(
+        "--video-engine-url",
+        default=os.getenv("VIDEO_ENGINE_URL", "http://localhost:8002"),
+    )
+    parser.add_argument("--json", help="Also write the report to this file")
+    args = parser.parse_args(argv)
+
+    generator = LoadGenerator(
+        ai_logic_url=args.ai_logic_url,
+        video_engine_url=args.video_engine_url,
+        rps=args.rps,
+        duration=args.duration,
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        topics=args.topics,
+        script_duration=args.script_duration,
+    )
+    report = generator.run(args.targets)
+    print_report(report)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -45,6 +45,7 @@ video_assembler = VideoAssembler(
     width=int(os.getenv("VIDEO_WIDTH", "1080")),
     height=int(os.getenv("VIDEO_HEIGHT", "1920")),
     fps=int(os.getenv("VIDEO_FPS", "30")),
+    buffer_frames=int(os.getenv("VIDEO_FRAME_BUFFER", "8")),
 )
 
 
@@ -0,0 +1,254 @@
+# In-process script -> video pipeline for Auto-Short-Factory
+import importlib
+import importlib.util
+import os
+import queue
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Dict, Iterable, List, Optional
+
+from pydantic import BaseModel
+
+from .compositor import load_image
+from .video_assembler import VideoAssembler
+
+DEFAULT_AI_LOGIC_DIR = Path(__file__).resolve().parents[2] / "ai-logic"
+
+
+def load_ai_logic(path: Optional[str] = None) -> ModuleType:
+    """
+    Import the ai-logic service package as `ai_logic`
+
+    Both services ship a top-level `src` package, so ai-logic is loaded under
+    its own name to live in the same process as the video engine.
+
+    Args:
+        path: ai-logic app directory (defaults to AI_LOGIC_DIR or the sibling app)
+
+    Returns:
+        The `ai_logic` package with `gemini_client` and `schemas` loaded
+    """
+    if "ai_logic" not in sys.modules:
+        root = Path(path or os.getenv("AI_LOGIC_DIR", DEFAULT_AI_LOGIC_DIR)) / "src"
+        spec = importlib.util.spec_from_file_location(
+            "ai_logic", root / "__init__.py", submodule_search_locations=[str(root)]
+        )
+        if spec is None or spec.loader is None:
+            raise ImportError(f"ai-logic package not found in {root}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["ai_logic"] = module
+        spec.loader.exec_module(module)
+
+    importlib.import_module("ai_logic.schemas")
+    importlib.import_module("ai_logic.gemini_client")
+    return sys.modules["ai_logic"]
+
+
+def prefetch_assets(
+    script: Dict[str, Any], executor: ThreadPoolExecutor
+) -> Dict[str, Future]:
+    """Start downloading every image referenced by the script's scenes"""
+    assets: Dict[str, Future] = {}
+    for scene in script["scenes"]:
+        location = scene["content"]
+        if scene["type"] == "image" and location not in assets:
+            assets[location] = executor.submit(load_image, location)
+    return assets
+
+
+class PipelineResult(BaseModel):
+    """Outcome of one topic through the pipeline"""
+
+    topic: str
+    success: bool
+    script_id: Optional[str] = None
+    output_path: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    script_seconds: float = 0.0
+    render_seconds: float = 0.0
+
+
+class VideoPipeline:
+    """Runs topics through script generation and rendering as bounded stages"""
+
+    def __init__(
+        self,
+        script_client,
+        output_dir: str = "output",
+        width: int = 1080,
+        height: int = 1920,
+        fps: int = 30,
+        buffer_frames: int = 8,
+        script_workers: int = 2,
+        prefetch_workers: int = 4,
+        render_workers: int = 1,
+        queue_size: int = 2,
+    ):
+        """
+        Args:
+            script_client: Object with `generate_script(request)`, e.g. GeminiClient
+            output_dir: Directory for finished videos
+            script_workers: Concurrent script generations
+            prefetch_workers: Concurrent asset downloads
+            render_workers: Concurrent renders (one VideoAssembler each)
+            queue_size: Validated scripts queued for a renderer; while the
+                queue is full each script worker holds at most one more
+        """
+        self.script_client = script_client
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.width = width
+        self.height = height
+        self.fps = fps
+        self.buffer_frames = buffer_frames
+        self.script_workers = max(1, script_workers)
+        self.prefetch_workers = max(1, prefetch_workers)
+        self.render_workers = max(1, render_workers)
+        self.queue_size = max(1, queue_size)
+
+    def run_one(self, request) -> PipelineResult:
+        """Generate and render a single topic"""
+        return self.run([request])[0]
+
+    def run(self, requests: Iterable) -> List[PipelineResult]:
+        """
+        Run many topics through the pipeline concurrently
+
+        Scripts are generated while earlier topics render; the bounded hand-off
+        queue stops script generation from racing ahead of the renderers.
+
+        Args:
+            requests: GeminiRequest objects, one per topic
+
+        Returns:
+            PipelineResult per request, in input order
+        """
+        requests = list(requests)
+        results: List[Optional[PipelineResult]] = [None] * len(requests)
+
+        pending: "queue.Queue[tuple]" = queue.Queue()
+        for item in enumerate(requests):
+            pending.put(item)
+        ready: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=self.queue_size)
+
+        with ThreadPoolExecutor(
+            max_workers=self.prefetch_workers, thread_name_prefix="prefetch"
+        ) as prefetch:
+            scripters = [
+                threading.Thread(
+                    target=self._script_worker,
+                    args=(pending, ready, prefetch, results),
+                    name=f"script-{i}",
+                )
+                for i in range(self.script_workers)
+            ]
+            renderers = [
+                threading.Thread(
+                    target=self._render_worker,
+                    args=(ready, results),
+                    name=f"render-{i}",
+                )
+                for i in range(self.render_workers)
+            ]
+
+            for worker in scripters + renderers:
+                worker.start()
+            for worker in scripters:
+                worker.join()
+            for _ in renderers:
+                ready.put(None)
+            for worker in renderers:
+                worker.join()
+
+        return results
+
+    def _script_worker(
+        self,
+        pending: "queue.Queue[tuple]",
+        ready: "queue.Queue[Optional[tuple]]",
+        prefetch: ThreadPoolExecutor,
+        results: List[Optional[PipelineResult]],
+    ):
+        """Generate scripts and hand them to the renderers as soon as they validate"""
+        while True:
+            try:
+                index, request = pending.get_nowait()
+            except queue.Empty:
+                return
+
+            started = time.perf_counter()
+            try:
+                script = self.script_client.generate_script(request).model_dump()
+            except Exception as e:
+                print(f"❌ Script failed for '{request.topic}': {e}")
+                results[index] = PipelineResult(
+                    topic=request.topic,
+                    success=False,
+                    error=f"Failed to generate script: {e}",
+                    script_seconds=time.perf_counter() - started,
+                )
+                continue
+
+            assets = prefetch_assets(script, prefetch)
+            # Blocks while renderers are busy, keeping in-flight scripts bounded
+            ready.put((index, request, script, assets, time.perf_counter() - started))
+
+    def _render_worker(
+        self,
+        ready: "queue.Queue[Optional[tuple]]",
+        results: List[Optional[PipelineResult]],
+    ):
+        """Render validated scripts; each worker owns its own assembler buffers"""
+        # A worker whose setup fails keeps draining the queue, marking items
+        # failed, so script workers never block on a queue nobody reads
+        assembler: Optional[VideoAssembler] = None
+        try:
+            assembler = VideoAssembler(
+                width=self.width,
+                height=self.height,
+                fps=self.fps,
+                buffer_frames=self.buffer_frames,
+            )
+        except Exception as e:
+            print(f"❌ Renderer setup failed: {e}")
+            setup_error = e
+
+        while True:
+            item = ready.get()
+            if item is None:
+                return
+            index, request, script, assets, script_seconds = item
+
+            output_path = self.output_dir / f"{script['id']}.mp4"
+            started = time.perf_counter()
+            try:
+                if assembler is None:
+                    raise RuntimeError(f"Renderer unavailable: {setup_error}")
+                metadata = assembler.assemble_video(
+                    script=script, output_path=str(output_path), assets=assets
+                )
+                metadata["outputUrl"] = f"file://{output_path.absolute()}"
+                results[index] = PipelineResult(
+                    topic=request.topic,
+                    success=True,
+                    script_id=script["id"],
+                    output_path=str(output_path),
+                    metadata=metadata,
+                    script_seconds=script_seconds,
+                    render_seconds=time.perf_counter() - started,
+                )
+            except Exception as e:
+                print(f"❌ Render failed for '{request.topic}': {e}")
+                results[index] = PipelineResult(
+                    topic=request.topic,
+                    success=False,
+                    script_id=script["id"],
+                    error=f"Failed to generate video: {e}",
+                    script_seconds=script_seconds,
+                    render_seconds=time.perf_counter() - started,
+                )
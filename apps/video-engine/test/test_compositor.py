@@ -0,0 +1,351 @@
+from io import BytesIO
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from src import compositor
+from src.compositor import POP_SCALES, FrameCompositor
+
+WIDTH, HEIGHT, FPS = 90, 160, 10
+TRANSITIONS = ["fade", "slide", "zoom", "none"]
+
+
+@pytest.fixture
+def comp() -> FrameCompositor:
+    return FrameCompositor(width=WIDTH, height=HEIGHT, fps=FPS, buffer_frames=3)
+
+
+def text_scene(transition: str, duration: float = 2.0, transition_duration=0.5):
+    return {
+        "id": "scene_1",
+        "duration": duration,
+        "type": "text",
+        "content": "Hook",
+        "transition": transition,
+        "transition_duration": transition_duration,
+    }
+
+
+def source_span(transform, size: int):
+    """Source coordinates sampled by the first and last pixel centres"""
+    scale, offset = transform
+    return scale * 0.5 + offset, scale * (size - 0.5) + offset
+
+
+@pytest.mark.parametrize("transition", TRANSITIONS)
+@pytest.mark.parametrize("image_size", [(400, 200), (100, 400), (90, 160)])
+def test_ken_burns_stays_inside_source(comp, transition, image_size):
+    source = comp._cover(Image.new("RGB", image_size))
+    src_h, src_w = source.shape[:2]
+    assert src_w >= WIDTH and src_h >= HEIGHT
+
+    transforms = comp._ken_burns(transition, 40, source.shape)
+
+    assert transforms.shape == (40, 4)
+    for sx, tx, sy, ty in transforms:
+        x0, x1 = source_span((sx, tx), WIDTH)
+        y0, y1 = source_span((sy, ty), HEIGHT)
+        assert 0 <= x0 <= x1 <= src_w + 1e-3
+        assert 0 <= y0 <= y1 <= src_h + 1e-3
+
+
+def test_ken_burns_zoom_and_pan_curves(comp):
+    shape = comp._cover(Image.new("RGB", (400, 200))).shape
+
+    zoom = comp._ken_burns("zoom", 20, shape)
+    assert zoom[0, 0] == pytest.approx(1.0)
+    assert zoom[-1, 0] == pytest.approx(1 / 1.2)
+
+    slide = comp._ken_burns("slide", 20, shape)
+    assert np.all(np.diff(slide[:, 1]) >= 0)
+    assert slide[-1, 1] > slide[0, 1]
+
+    static = comp._ken_burns("none", 20, shape)
+    assert np.all(static == static[0])
+
+
+@pytest.mark.parametrize("transition", TRANSITIONS)
+def test_text_motion_settles_to_identity(comp, transition):
+    transforms = comp._text_motion(transition, 20, 5)
+
+    assert transforms.shape == (20, 4)
+    np.testing.assert_allclose(transforms[5:], [[1.0, 0.0, 1.0, 0.0]] * 15)
+
+
+def test_text_motion_start_positions(comp):
+    slide = comp._text_motion("slide", 20, 5)
+    assert slide[0, 3] == pytest.approx(-0.25 * HEIGHT)
+    assert np.all(np.diff(slide[:5, 3]) >= 0)
+
+    zoom = comp._text_motion("zoom", 20, 5)
+    assert zoom[0, 0] == pytest.approx(1 / 0.85)
+    # Zoom is centred: the frame centre maps onto the source centre
+    assert zoom[0, 0] * WIDTH / 2 + zoom[0, 1] == pytest.approx(WIDTH / 2)
+
+
+def test_transition_longer_than_scene_is_clamped(comp):
+    track = comp._prepare_scene(text_scene("slide", 0.5, 5.0), {})
+
+    assert track.frames == 5
+    assert track.transforms.shape == (5, 4)
+
+
+@pytest.mark.parametrize("transition", TRANSITIONS)
+def test_fade_alphas(comp, transition):
+    track = comp._prepare_scene(text_scene(transition), {})
+
+    if transition == "fade":
+        assert track.alphas[0] == 0.0
+        assert np.all(np.diff(track.alphas[:5]) > 0)
+        assert np.all(track.alphas[5:] == 1.0)
+    else:
+        assert np.all(track.alphas == 1.0)
+
+
+def test_fade_starts_from_background(comp):
+    track = comp._prepare_scene(text_scene("fade"), {})
+    frame = np.empty((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    comp._draw_scene_frame(track, 0, frame)
+    assert np.all(frame == track.fill.astype(np.uint8))
+
+    comp._draw_scene_frame(track, track.frames - 1, frame)
+    assert np.array_equal(frame, track.source)
+
+
+def test_unavailable_image_falls_back_to_card(comp):
+    scene = {**text_scene("zoom"), "type": "image", "content": "/no/such.png"}
+
+    track = comp._prepare_scene(scene, {})
+
+    assert track.source.shape == (HEIGHT, WIDTH, 3)
+
+
+def write_png(path, size=(8, 8)) -> bytes:
+    buffer = BytesIO()
+    Image.new("RGB", size, "red").save(buffer, "PNG")
+    path.write_bytes(buffer.getvalue())
+    return buffer.getvalue()
+
+
+def test_local_images_only_load_from_asset_dir(tmp_path, monkeypatch):
+    assets, outside = tmp_path / "assets", tmp_path / "outside.png"
+    assets.mkdir()
+    write_png(assets / "cat.png")
+    write_png(outside)
+
+    assert compositor.load_image(str(assets / "cat.png")) is None
+
+    monkeypatch.setenv("VIDEO_ASSET_DIR", str(assets))
+    assert compositor.load_image("cat.png").size == (8, 8)
+    assert compositor.load_image(str(assets / "cat.png")).size == (8, 8)
+    assert compositor.load_image("../outside.png") is None
+    assert compositor.load_image(str(outside)) is None
+
+
+def test_local_images_over_size_cap_are_refused(tmp_path, monkeypatch):
+    monkeypatch.setenv("VIDEO_ASSET_DIR", str(tmp_path))
+    size = len(write_png(tmp_path / "cat.png"))
+
+    monkeypatch.setenv("VIDEO_MAX_ASSET_BYTES", str(size - 1))
+    assert compositor.load_image("cat.png") is None
+
+
+class FakeResponse:
+    def __init__(self, body: bytes, headers=None):
+        self.body = body
+        self.headers = headers or {}
+        self.read = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_content(self, chunk_size):
+        for start in range(0, len(self.body), chunk_size):
+            self.read += chunk_size
+            yield self.body[start : start + chunk_size]
+
+
+@pytest.mark.parametrize("declared", [False, True])
+def test_downloads_stop_at_size_cap(tmp_path, monkeypatch, declared):
+    body = write_png(tmp_path / "cat.png", (64, 64))
+    headers = {"Content-Length": str(len(body))} if declared else {}
+    response = FakeResponse(body, headers)
+    monkeypatch.setattr(compositor.requests, "get", lambda url, **kw: response)
+
+    monkeypatch.setenv("VIDEO_MAX_ASSET_BYTES", str(len(body)))
+    assert compositor.load_image("https://example.com/cat.png").size == (64, 64)
+
+    response.read = 0
+    monkeypatch.setenv("VIDEO_MAX_ASSET_BYTES", str(len(body) // 2))
+    assert compositor.load_image("https://example.com/cat.png") is None
+    assert response.read <= len(body) // 2 + 64 * 1024
+
+
+def caption(text: str, position: str = "bottom", font_size: int = 12, start=0, end=1):
+    return {
+        "text": text,
+        "start_time": start,
+        "end_time": end,
+        "style": {"font_size": font_size, "position": position},
+    }
+
+
+def test_oversized_caption_is_clamped_to_frame(comp):
+    (sprite,) = comp._prepare_captions(
+        [caption("An extremely long caption " * 20, font_size=120)]
+    )
+
+    assert len(sprite.variants) == len(POP_SCALES)
+    for y, x, rgb, inverse_alpha, work in sprite.variants:
+        h, w = rgb.shape[:2]
+        assert 0 <= x and x + w <= WIDTH
+        assert 0 <= y and y + h <= HEIGHT
+        assert inverse_alpha.shape == (h, w, 1)
+        assert work.shape == (h, w, 3)
+
+
+@pytest.mark.parametrize(
+    "style",
+    [
+        {"font_color": "rgba(0,0,0,0.6)", "background_color": "not a colour"},
+        {"font_color": None, "background_color": 12},
+        {"font_size": 0},
+        {"font_size": -5},
+        {"font_size": "large"},
+    ],
+)
+def test_invalid_caption_style_falls_back(comp, style):
+    (sprite,) = comp._prepare_captions(
+        [{"text": "Hi", "start_time": 0, "end_time": 1, "style": style}]
+    )
+
+    assert sprite.variants[-1][2].size > 0
+
+
+def test_invalid_caption_colours_use_scene_style_defaults(comp):
+    patch = comp._caption_patch("Hi", {"background_color": "rgba(0,0,0,0.6)"})
+
+    assert patch.getpixel((0, 0)) == (0, 0, 0, 0xAA)
+
+
+def test_caption_positions_and_timing(comp):
+    sprites = comp._prepare_captions(
+        [
+            caption("Top", "top", start=0.5, end=1.5),
+            caption("Mid", "center"),
+            caption("Low", "bottom"),
+        ]
+    )
+
+    centres = [
+        sprite.variants[-1][0] + sprite.variants[-1][2].shape[0] / 2
+        for sprite in sprites
+    ]
+    assert centres[0] < centres[1] < centres[2]
+    assert (sprites[0].start_frame, sprites[0].end_frame) == (5, 15)
+    # Pop-in grows towards the final size
+    assert sprites[0].variants[0][2].shape[1] < sprites[0].variants[-1][2].shape[1]
+
+
+def test_captions_drawn_only_while_active(comp):
+    sprites = comp._prepare_captions([caption("Hi", start=0.5, end=1.0)])
+    blank = np.zeros((HEIGHT, WIDTH, 3), dtype=np.uint8)
+
+    for index, visible in [(4, False), (5, True), (9, True), (10, False)]:
+        frame = blank.copy()
+        comp._draw_captions(sprites, index, frame)
+        assert frame.any() == visible
+
+
+class FakeStdin:
+    def __init__(self, fail_after=None):
+        self.frames = 0
+        self.bytes = 0
+        self.buffers = set()
+        self.fail_after = fail_after
+        self.closed = False
+
+    def write(self, data):
+        if self.fail_after is not None and self.frames >= self.fail_after:
+            raise BrokenPipeError("encoder went away")
+        self.frames += 1
+        self.bytes += data.nbytes
+        self.buffers.add(id(data.obj))
+
+    def close(self):
+        self.closed = True
+
+
+class FakeProcess:
+    def __init__(self, stdin: FakeStdin, returncode: int = 0):
+        self.stdin = stdin
+        self._returncode = returncode
+        self.returncode = None
+
+    def wait(self):
+        self.returncode = self._returncode
+        return self.returncode
+
+
+class FakeStream:
+    """Stands in for the ffmpeg-python builder chain"""
+
+    def __init__(self, process: FakeProcess):
+        self.process = process
+
+    def input(self, *args, **kwargs):
+        return self
+
+    output = global_args = input
+
+    def overwrite_output(self):
+        return self
+
+    def run_async(self, **kwargs):
+        assert kwargs.get("pipe_stdin")
+        return self.process
+
+
+def fake_ffmpeg(monkeypatch, **kwargs) -> FakeProcess:
+    returncode = kwargs.pop("returncode", 0)
+    process = FakeProcess(FakeStdin(**kwargs), returncode)
+    monkeypatch.setattr(compositor, "ffmpeg", FakeStream(process))
+    return process
+
+
+def test_render_streams_every_frame_through_bounded_pool(comp, monkeypatch):
+    process = fake_ffmpeg(monkeypatch)
+    scenes = [text_scene(t, duration=1.0) for t in TRANSITIONS]
+
+    written = comp.render(scenes, [caption("Hi", end=2)], "out.mp4")
+
+    assert written == 4 * FPS
+    assert process.stdin.frames == written
+    assert process.stdin.bytes == written * WIDTH * HEIGHT * 3
+    assert len(process.stdin.buffers) <= comp.buffer_frames
+    assert process.stdin.closed
+
+
+def test_render_propagates_writer_errors(comp, monkeypatch):
+    process = fake_ffmpeg(monkeypatch, fail_after=3)
+
+    with pytest.raises(BrokenPipeError):
+        comp.render([text_scene("fade", duration=3.0)], [], "out.mp4")
+
+    assert process.stdin.closed
+    assert process.returncode is not None
+
+
+def test_render_raises_on_encoder_failure(comp, monkeypatch):
+    fake_ffmpeg(monkeypatch, returncode=1)
+
+    with pytest.raises(RuntimeError, match="code 1"):
+        comp.render([text_scene("none", duration=0.5)], [], "out.mp4")
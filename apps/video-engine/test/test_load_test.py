@@ -0,0 +1,70 @@
+import pytest
+
+from src.load_test import LoadGenerator, TargetStats, classify_error, percentile
+
+
+@pytest.mark.parametrize(
+    "values, pct, expected",
+    [
+        ([1, 2, 3, 4, 5], 50, 3),
+        (list(range(1, 31)), 95, 29),
+        (list(range(1, 101)), 99, 99),
+        ([5, 1, 3], 100, 5),
+        ([7], 50, 7),
+        ([4, 2], 1, 2),
+    ],
+)
+def test_percentile_is_nearest_rank(values, pct, expected):
+    assert percentile(values, pct) == expected
+
+
+def test_percentile_of_nothing():
+    assert percentile([], 50) is None
+
+
+def test_ticks_over_the_cap_are_skipped():
+    stats = TargetStats("script")
+
+    assert [stats.try_acquire(2) for _ in range(3)] == [True, True, False]
+    stats.record("ok", 0.5)
+    assert stats.try_acquire(2)
+
+    summary = stats.summary()
+    assert summary["scheduled"] == 4
+    assert summary["skipped"] == 1
+    assert summary["completed"] == 1
+    assert summary["peak_in_flight"] == 2
+    assert stats.in_flight == 2
+
+
+@pytest.mark.parametrize(
+    "error, bucket",
+    [
+        (
+            "All Gemini API keys failed: aaaa...1111: 429 Resource exhausted",
+            "rate_limited",
+        ),
+        ("Failed to generate script: Invalid JSON response", "malformed_json"),
+        ("Failed to generate video: ffmpeg error", "app_error"),
+    ],
+)
+def test_classify_error(error, bucket):
+    assert classify_error(error) == bucket
+
+
+def test_key_delta_subtracts_counters_per_key():
+    before = {"aaaa...1111": {"attempts": 3, "successes": 2, "rate_limited": 1}}
+    after = {
+        "aaaa...1111": {"attempts": 10, "successes": 6, "rate_limited": 4},
+        "bbbb...2222": {"attempts": 2, "successes": 2, "rate_limited": 0},
+    }
+
+    assert LoadGenerator._key_delta(before, after) == {
+        "aaaa...1111": {"attempts": 7, "successes": 4, "rate_limited": 3},
+        "bbbb...2222": {"attempts": 2, "successes": 2, "rate_limited": 0},
+    }
+
+
+@pytest.mark.parametrize("before, after", [(None, {}), ({}, None)])
+def test_key_delta_without_stats(before, after):
+    assert LoadGenerator._key_delta(before, after) is None
@@ -0,0 +1,154 @@
+import threading
+import time
+from concurrent.futures import Future
+
+from src import pipeline
+from src.pipeline import VideoPipeline
+
+
+class Request:
+    def __init__(self, topic: str):
+        self.topic = topic
+
+
+class Script:
+    def __init__(self, topic: str):
+        self.topic = topic
+
+    def model_dump(self):
+        return {"id": f"script_{self.topic}", "scenes": []}
+
+
+class FakeClient:
+    def generate_script(self, request):
+        if request.topic == "bad":
+            raise ValueError("boom")
+        return Script(request.topic)
+
+
+class ImageScript(Script):
+    def model_dump(self):
+        return {
+            "id": f"script_{self.topic}",
+            "scenes": [
+                {"type": "image", "content": f"https://example.com/{self.topic}.png"},
+                {"type": "text", "content": self.topic},
+            ],
+        }
+
+
+class CountingClient:
+    def __init__(self):
+        self.generated = 0
+        self._lock = threading.Lock()
+
+    def generate_script(self, request):
+        with self._lock:
+            self.generated += 1
+        # Even topics take longer, so scripts finish out of input order
+        time.sleep(0.02 if int(request.topic) % 2 == 0 else 0)
+        return ImageScript(request.topic)
+
+
+def recording_assembler(calls: list, gate: threading.Event):
+    class RecordingAssembler:
+        def __init__(self, **kwargs):
+            pass
+
+        def assemble_video(self, script, output_path, assets=None):
+            gate.wait()
+            calls.append((script["id"], output_path, assets))
+            return {"id": script["id"]}
+
+    return RecordingAssembler
+
+
+def wait_until_settled(read, timeout: float = 5.0, quiet: float = 0.2):
+    """Poll until `read()` stops changing for `quiet` seconds"""
+    deadline = time.perf_counter() + timeout
+    value, changed = read(), time.perf_counter()
+    while time.perf_counter() < deadline:
+        time.sleep(0.02)
+        if read() != value:
+            value, changed = read(), time.perf_counter()
+        elif time.perf_counter() - changed >= quiet:
+            break
+    return value
+
+
+def run_with_timeout(target, timeout: float = 10.0):
+    box = {}
+    worker = threading.Thread(target=lambda: box.update(result=target()))
+    worker.start()
+    worker.join(timeout)
+    assert not worker.is_alive(), "pipeline hung"
+    return box["result"]
+
+
+def test_failed_renderer_setup_fails_items_instead_of_hanging(tmp_path, monkeypatch):
+    def broken_assembler(**kwargs):
+        raise OSError("no temp dir")
+
+    monkeypatch.setattr(pipeline, "VideoAssembler", broken_assembler)
+    vp = VideoPipeline(
+        FakeClient(),
+        output_dir=str(tmp_path),
+        script_workers=2,
+        render_workers=1,
+        queue_size=1,
+    )
+    requests = [Request(str(i)) for i in range(5)] + [Request("bad")]
+
+    results = run_with_timeout(lambda: vp.run(requests))
+
+    assert [result.topic for result in results] == [r.topic for r in requests]
+    assert not any(result.success for result in results)
+    assert all("Renderer unavailable" in result.error for result in results[:5])
+    assert "boom" in results[-1].error
+
+
+def test_renders_prefetched_scripts_in_input_order(tmp_path, monkeypatch):
+    calls, gate = [], threading.Event()
+    monkeypatch.setattr(pipeline, "VideoAssembler", recording_assembler(calls, gate))
+    monkeypatch.setattr(pipeline, "load_image", lambda location: f"loaded:{location}")
+    client = CountingClient()
+    vp = VideoPipeline(
+        client,
+        output_dir=str(tmp_path),
+        script_workers=2,
+        render_workers=1,
+        queue_size=2,
+    )
+    requests = [Request(str(i)) for i in range(8)]
+
+    box = {}
+    runner = threading.Thread(target=lambda: box.update(results=vp.run(requests)))
+    runner.start()
+    try:
+        # One script renders, queue_size wait in the queue and each script
+        # worker holds at most one more while the queue is full
+        generated = wait_until_settled(lambda: client.generated)
+        assert generated <= 1 + vp.queue_size + vp.script_workers
+        assert generated < len(requests)
+        assert calls == []
+    finally:
+        gate.set()
+        runner.join(10.0)
+    assert not runner.is_alive(), "pipeline hung"
+
+    results = box["results"]
+    assert [result.topic for result in results] == [r.topic for r in requests]
+    assert all(result.success for result in results)
+    for result in results:
+        assert result.output_path == str(tmp_path / f"{result.script_id}.mp4")
+        assert result.metadata["outputUrl"].endswith(f"{result.script_id}.mp4")
+
+    assert sorted(script_id for script_id, _, _ in calls) == sorted(
+        f"script_{r.topic}" for r in requests
+    )
+    for script_id, output_path, assets in calls:
+        url = f"https://example.com/{script_id.removeprefix('script_')}.png"
+        assert output_path == str(tmp_path / f"{script_id}.mp4")
+        assert list(assets) == [url]
+        assert isinstance(assets[url], Future)
+        assert assets[url].result() == f"loaded:{url}"
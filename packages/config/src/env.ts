@@ -23,6 +23,9 @@ const envSchema = z.object({
     VIDEO_WIDTH: z.coerce.number().default(1080),
     VIDEO_HEIGHT: z.coerce.number().default(1920),
     VIDEO_FPS: z.coerce.number().default(30),
+    VIDEO_FRAME_BUFFER: z.coerce.number().default(8),
+    VIDEO_ASSET_DIR: z.string().optional(),
+    VIDEO_MAX_ASSET_BYTES: z.coerce.number().default(20 * 1024 * 1024),
 
     // Google Sheets / Forms Logging
     GOOGLE_FORM_URL: z.string().default('https://docs.google.com/forms/d/e/1FAIpQLSdHpIZCuvVUayjpfWDuuYGzR73dEXK6RjvAEwiQ8NbGq1eKWg/formResponse'),
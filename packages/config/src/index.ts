@@ -60,6 +60,9 @@ export const videoConfig = {
     width: env.VIDEO_WIDTH,
     height: env.VIDEO_HEIGHT,
     fps: env.VIDEO_FPS,
+    frameBuffer: env.VIDEO_FRAME_BUFFER,
+    assetDir: env.VIDEO_ASSET_DIR,
+    maxAssetBytes: env.VIDEO_MAX_ASSET_BYTES,
     aspectRatio: '9:16' as const,
     codec: 'libx264' as const,
     audioCodec: 'aac' as const,